@@ -430,20 +430,19 @@ class AudioFileManager:
                 wf.writeframes(pcm_data)
             
             logger.debug(f"WAV файл сохранен: {filename}")
-            return ValidationResult(True, f"WAV файл успешно сохранен: {filename}")
+            return ValidationResult.ok(f"WAV файл успешно сохранен: {filename}")
             
         except Exception as e:
             error_msg = f"Ошибка при сохранении WAV файла {filename}: {e}"
             logger.error(error_msg)
-            return ValidationResult(False, error_msg)
+            return ValidationResult.fail(error_msg)
     
     @staticmethod
     def convert_to_mp3(wav_path: str, mp3_path: str, 
                       bitrate: str = AppConfig.MP3_BITRATE) -> ValidationResult:
         """Конвертирует WAV файл в MP3 формат, совместимый с WhatsApp."""
         if not PYDUB_AVAILABLE:
-            return ValidationResult(
-                False, 
+            return ValidationResult.fail(
                 "Библиотека pydub не установлена. Установите её командой: pip install pydub"
             )
         
@@ -455,7 +454,7 @@ class AudioFileManager:
             
             # Проверяем существование исходного файла
             if not os.path.exists(wav_path):
-                return ValidationResult(False, f"Исходный WAV файл не найден: {wav_path}")
+                return ValidationResult.fail(f"Исходный WAV файл не найден: {wav_path}")
             
             # Загружаем WAV файл
             audio = AudioSegment.from_wav(wav_path)
@@ -474,12 +473,12 @@ class AudioFileManager:
             )
             
             logger.info(f"MP3 файл успешно создан: {mp3_path}")
-            return ValidationResult(True, f"MP3 файл успешно создан: {mp3_path}")
+            return ValidationResult.ok(f"MP3 файл успешно создан: {mp3_path}")
             
         except Exception as e:
             error_msg = f"Ошибка при конвертации в MP3: {e}"
             logger.error(error_msg)
-            return ValidationResult(False, error_msg)
+            return ValidationResult.fail(error_msg)
         finally:
             # Гарантированно удаляем временный файл
             if os.path.exists(temp_wav):
@@ -549,48 +548,48 @@ class AudioPlayer:
             self.player.setSource(QUrl.fromLocalFile(temp_path))
             
             logger.debug("Аудио данные загружены для воспроизведения")
-            return ValidationResult(True, "Аудио готово к воспроизведению")
+            return ValidationResult.ok("Аудио готово к воспроизведению")
             
         except Exception as e:
             error_msg = f"Ошибка загрузки аудио данных: {e}"
             logger.error(error_msg)
-            return ValidationResult(False, error_msg)
+            return ValidationResult.fail(error_msg)
     
     def play(self) -> ValidationResult:
         """Начинает воспроизведение."""
         if not self.current_audio_data:
-            return ValidationResult(False, "Нет загруженных аудио данных")
+            return ValidationResult.fail("Нет загруженных аудио данных")
         
         try:
             self.player.play()
             logger.debug("Воспроизведение начато")
-            return ValidationResult(True, "Воспроизведение начато")
+            return ValidationResult.ok("Воспроизведение начато")
         except Exception as e:
             error_msg = f"Ошибка воспроизведения: {e}"
             logger.error(error_msg)
-            return ValidationResult(False, error_msg)
+            return ValidationResult.fail(error_msg)
     
     def pause(self) -> ValidationResult:
         """Приостанавливает воспроизведение."""
         try:
             self.player.pause()
             logger.debug("Воспроизведение приостановлено")
-            return ValidationResult(True, "Воспроизведение приостановлено")
+            return ValidationResult.ok("Воспроизведение приостановлено")
         except Exception as e:
             error_msg = f"Ошибка паузы: {e}"
             logger.error(error_msg)
-            return ValidationResult(False, error_msg)
+            return ValidationResult.fail(error_msg)
     
     def stop(self) -> ValidationResult:
         """Останавливает воспроизведение."""
         try:
             self.player.stop()
             logger.debug("Воспроизведение остановлено")
-            return ValidationResult(True, "Воспроизведение остановлено")
+            return ValidationResult.ok("Воспроизведение остановлено")
         except Exception as e:
             error_msg = f"Ошибка остановки: {e}"
             logger.error(error_msg)
-            return ValidationResult(False, error_msg)
+            return ValidationResult.fail(error_msg)
     
     def get_player(self) -> QMediaPlayer:
         """Возвращает объект медиа плеера для подключения сигналов."""
@@ -656,7 +655,7 @@ class TextToSpeechCore:
         if not voice_validation.is_valid:
             return voice_validation
         
-        return ValidationResult(True, "Запрос валиден")
+        return ValidationResult.ok("Запрос валиден")
     
     def get_available_voices(self) -> list[str]:
         """Возвращает список доступных голосов."""
@@ -59,6 +59,9 @@ class ModernTTSApp(QMainWindow):
         self.temp_manager = TempFileManager()
         self.audio_player = AudioPlayer()
         
+        # Лист стилей нужен уже диалогу ввода API ключа
+        StyleManager.install_application_style(QApplication.instance(), self.settings_manager.get_theme())
+        
         # Состояние приложения
         self.audio_data: Optional[bytes] = None
         self.current_worker = None
@@ -399,7 +402,8 @@ class ModernTTSApp(QMainWindow):
     def _apply_theme(self):
         """Применяет выбранную тему."""
         theme = self.settings_manager.get_theme()
-        self.setStyleSheet(StyleManager.get_main_window_style(theme))
+        StyleManager.install_application_style(QApplication.instance(), theme)
+        self.setStyleSheet(StyleManager.stylesheet_for("main_window", theme))
         
         # Обновляем цвета текста после смены темы
         if hasattr(self, 'text_input'):
@@ -468,7 +472,7 @@ class ModernTTSApp(QMainWindow):
             return
 
         theme = self.settings_manager.get_theme()
-        style = StyleManager.get_text_edit_style(theme)
+        style = StyleManager.stylesheet_for("text_edit", theme)
         self.text_input.setStyleSheet(style)
         self.text_input.update()
 
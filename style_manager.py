@@ -6,110 +6,75 @@
 from config import AppConfig
 
 
-class StyleManager:
-    """Менеджер стилей приложения."""
-    
-    @staticmethod
-    def get_button_style(color_type: str = "primary", size: str = "normal") -> str:
-        """Возвращает стиль для кнопок."""
-        colors = AppConfig.Colors
-        sizes = AppConfig.Sizes
-        
-        if color_type == "primary":
-            bg_color = f"stop:0 {colors.PRIMARY}, stop:1 {colors.PRIMARY_PRESSED}"
-            hover_color = f"stop:0 {colors.PRIMARY_HOVER}, stop:1 {colors.PRIMARY}"
-            pressed_color = f"stop:0 {colors.PRIMARY_PRESSED}, stop:1 #2a6aa3"
-        elif color_type == "success":
-            bg_color = f"stop:0 {colors.SUCCESS}, stop:1 #1e7e34"
-            hover_color = f"stop:0 {colors.SUCCESS_HOVER}, stop:1 {colors.SUCCESS}"
-            pressed_color = f"stop:0 #1e7e34, stop:1 #155724"
-        elif color_type == "danger":
-            bg_color = f"stop:0 {colors.DANGER}, stop:1 #c82333"
-            hover_color = f"stop:0 {colors.DANGER_HOVER}, stop:1 {colors.DANGER}"
-            pressed_color = f"stop:0 #c82333, stop:1 #bd2130"
-        else:
-            bg_color = f"stop:0 {colors.PRIMARY}, stop:1 {colors.PRIMARY_PRESSED}"
-            hover_color = f"stop:0 {colors.PRIMARY_HOVER}, stop:1 {colors.PRIMARY}"
-            pressed_color = f"stop:0 {colors.PRIMARY_PRESSED}, stop:1 #2a6aa3"
-        
-        height = sizes.BUTTON_LARGE_HEIGHT if size == "large" else sizes.BUTTON_MIN_HEIGHT
-        
-        return f"""
-        QPushButton {{
+# Значения конфигурации, используемые в стилях, читаются один раз при импорте
+_COLORS = AppConfig.Colors
+_SIZES = AppConfig.Sizes
+_FONTS = AppConfig.Fonts
+_BUTTON_HEIGHT = _SIZES.BUTTON_MIN_HEIGHT
+_BUTTON_LARGE_HEIGHT = _SIZES.BUTTON_LARGE_HEIGHT
+_PADDING_LARGE_X2 = _SIZES.PADDING_LARGE * 2
+
+# === ШАБЛОНЫ СТИЛЕЙ ===
+# Тела QSS хранятся как готовые шаблоны и заполняются через format_map,
+# чтобы не пересобирать f-строки при каждом вызове.
+
+_BUTTON_TMPL = """
+        {scope}QPushButton {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1, {bg_color});
             border: none;
-            border-radius: {sizes.BORDER_RADIUS}px;
-            padding: {sizes.PADDING_MEDIUM}px {sizes.PADDING_LARGE * 2}px;
-            font-size: {AppConfig.Fonts.SIZE_MEDIUM}px;
-            font-weight: {AppConfig.Fonts.WEIGHT_BOLD};
+            border-radius: {border_radius}px;
+            padding: {padding_medium}px {padding_large_x2}px;
+            font-size: {font_medium}px;
+            font-weight: {weight_bold};
             color: white;
             min-height: {height}px;
         }}
-        
-        QPushButton:hover {{
+
+        {scope}QPushButton:hover {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1, {hover_color});
         }}
-        
-        QPushButton:pressed {{
+
+        {scope}QPushButton:pressed {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1, {pressed_color});
         }}
-        
-        QPushButton:disabled {{
+
+        {scope}QPushButton:disabled {{
             background-color: #555555;
             color: #888888;
         }}
         """
-    
-    @staticmethod
-    def get_text_edit_style(theme: str = "dark") -> str:
-        """Возвращает стиль для текстовых полей."""
-        colors = AppConfig.Colors
-        sizes = AppConfig.Sizes
-
-        if theme == "dark":
-            bg_color = colors.DARK_WIDGET_BG
-            border_color = colors.DARK_BORDER
-            text_color = colors.DARK_TEXT
-            scroll_color = colors.DARK_BORDER
-            scroll_handle = colors.DARK_TEXT_SECONDARY
-        else:
-            bg_color = colors.LIGHT_WIDGET_BG
-            border_color = colors.LIGHT_BORDER
-            text_color = colors.LIGHT_TEXT
-            scroll_color = colors.LIGHT_BORDER
-            scroll_handle = colors.LIGHT_TEXT_SECONDARY
-
-        return f"""
+
+_TEXT_EDIT_TMPL = """
         QTextEdit {{
-            background-color: {bg_color};
+            background-color: {widget_bg};
             border: 2px solid {border_color};
-            border-radius: {sizes.BORDER_RADIUS_LARGE}px;
-            padding: {sizes.PADDING_LARGE}px;
-            font-size: {AppConfig.Fonts.SIZE_LARGE}px;
+            border-radius: {border_radius_large}px;
+            padding: {padding_large}px;
+            font-size: {font_large}px;
             color: {text_color};
-            selection-background-color: {colors.PRIMARY};
+            selection-background-color: {primary};
         }}
 
         QTextEdit:focus {{
-            border: 2px solid {colors.PRIMARY};
+            border: 2px solid {primary};
         }}
 
         QTextEdit QScrollBar:vertical {{
             border: none;
-            background: {bg_color};
+            background: {widget_bg};
             width: 10px;
             border-radius: 5px;
             margin: 0px;
         }}
 
         QTextEdit QScrollBar::handle:vertical {{
-            background: {scroll_handle};
+            background: {secondary_text};
             min-height: 20px;
             border-radius: 4px;
         }}
 
         QTextEdit QScrollBar::handle:vertical:hover {{
-            background: {scroll_color};
+            background: {border_color};
         }}
 
         QTextEdit QScrollBar::add-line:vertical {{
@@ -124,42 +89,27 @@ class StyleManager:
             height: 0px;
         }}
         """
-    
-    @staticmethod
-    def get_combo_box_style(theme: str = "dark") -> str:
-        """Возвращает стиль для комбо-боксов."""
-        colors = AppConfig.Colors
-        sizes = AppConfig.Sizes
-        
-        if theme == "dark":
-            bg_color = colors.DARK_WIDGET_BG
-            border_color = colors.DARK_BORDER
-            text_color = colors.DARK_TEXT
-        else:
-            bg_color = colors.LIGHT_WIDGET_BG
-            border_color = colors.LIGHT_BORDER
-            text_color = colors.LIGHT_TEXT
-        
-        return f"""
+
+_COMBO_BOX_TMPL = """
         QComboBox {{
-            background-color: {bg_color};
+            background-color: {widget_bg};
             border: 2px solid {border_color};
-            border-radius: {sizes.BORDER_RADIUS}px;
-            padding: {sizes.PADDING_SMALL}px {sizes.PADDING_LARGE}px;
-            font-size: {AppConfig.Fonts.SIZE_MEDIUM}px;
+            border-radius: {border_radius}px;
+            padding: {padding_small}px {padding_large}px;
+            font-size: {font_medium}px;
             color: {text_color};
             min-height: 25px;
         }}
-        
+
         QComboBox:focus {{
-            border: 2px solid {colors.PRIMARY};
+            border: 2px solid {primary};
         }}
-        
+
         QComboBox::drop-down {{
             border: none;
             width: 20px;
         }}
-        
+
         QComboBox::down-arrow {{
             image: none;
             border-left: 5px solid transparent;
@@ -167,170 +117,291 @@ class StyleManager:
             border-top: 5px solid {text_color};
         }}
         """
-    
-    @staticmethod
-    def get_dialog_style(theme: str = "dark") -> str:
-        """Возвращает стиль для диалогов."""
-        colors = AppConfig.Colors
-        sizes = AppConfig.Sizes
-        
-        if theme == "dark":
-            bg_color = colors.DARK_BG
-            text_color = colors.DARK_TEXT
-            secondary_text = colors.DARK_TEXT_SECONDARY
-            widget_bg = colors.DARK_WIDGET_BG
-            border_color = colors.DARK_BORDER
-        else:
-            bg_color = colors.LIGHT_BG
-            text_color = colors.LIGHT_TEXT
-            secondary_text = colors.LIGHT_TEXT_SECONDARY
-            widget_bg = colors.LIGHT_WIDGET_BG
-            border_color = colors.LIGHT_BORDER
-        
-        button_style = StyleManager.get_button_style("primary")
-        
-        return f"""
-        QDialog {{
-            background-color: {bg_color};
+
+# Общий для всех окон фрагмент, устанавливается на уровне QApplication
+_GROUPBOX_TMPL = """
+        QGroupBox {{
+            font-size: {font_large}px;
+            font-weight: {weight_bold};
             color: {text_color};
+            border: 2px solid {border_color};
+            border-radius: {border_radius_large}px;
+            margin-top: {spacing_small}px;
+            padding-top: {spacing_small}px;
         }}
-        
-        QLabel {{
+
+        QGroupBox::title {{
+            subcontrol-origin: margin;
+            left: {spacing_small}px;
+            padding: 0 {padding_small}px 0 {padding_small}px;
             color: {text_color};
-            font-size: {AppConfig.Fonts.SIZE_MEDIUM}px;
+        }}
+        """
+
+# Селекторы диалогов подставляются через {dialog} и {scope}: правила входят в общий
+# лист приложения и ограничиваются диалогами с QDialog[theme="..."]
+_DIALOG_HEAD_TMPL = """
+        {dialog} {{
+            background-color: {bg};
+            color: {text_color};
+        }}
+
+        {scope}QLabel {{
+            color: {text_color};
+            font-size: {font_medium}px;
             line-height: 1.4;
         }}
-        
-        QLineEdit {{
+
+        {scope}QLineEdit {{
             background-color: {widget_bg};
             border: 2px solid {border_color};
-            border-radius: {sizes.BORDER_RADIUS}px;
-            padding: {sizes.PADDING_MEDIUM}px;
-            font-size: {AppConfig.Fonts.SIZE_MEDIUM}px;
+            border-radius: {border_radius}px;
+            padding: {padding_medium}px;
+            font-size: {font_medium}px;
             color: {text_color};
             min-height: 25px;
         }}
-        
-        QLineEdit:focus {{
-            border: 2px solid {colors.PRIMARY};
-        }}
-        
-        QGroupBox {{
-            font-size: {AppConfig.Fonts.SIZE_LARGE}px;
-            font-weight: {AppConfig.Fonts.WEIGHT_BOLD};
-            color: {text_color};
-            border: 2px solid {border_color};
-            border-radius: {sizes.BORDER_RADIUS_LARGE}px;
-            margin-top: {sizes.SPACING_SMALL}px;
-            padding-top: {sizes.SPACING_SMALL}px;
-        }}
-        
-        QGroupBox::title {{
-            subcontrol-origin: margin;
-            left: {sizes.SPACING_SMALL}px;
-            padding: 0 {sizes.PADDING_SMALL}px 0 {sizes.PADDING_SMALL}px;
-            color: {text_color};
+
+        {scope}QLineEdit:focus {{
+            border: 2px solid {primary};
         }}
-        
-        QRadioButton {{
+
+        {scope}QRadioButton {{
             color: {text_color};
-            font-size: {AppConfig.Fonts.SIZE_MEDIUM}px;
-            spacing: {sizes.PADDING_MEDIUM}px;
+            font-size: {font_medium}px;
+            spacing: {padding_medium}px;
         }}
-        
-        QRadioButton::indicator {{
+
+        {scope}QRadioButton::indicator {{
             width: 16px;
             height: 16px;
         }}
-        
-        QRadioButton::indicator:unchecked {{
+
+        {scope}QRadioButton::indicator:unchecked {{
             border: 2px solid {border_color};
             border-radius: 8px;
             background-color: {widget_bg};
         }}
-        
-        QRadioButton::indicator:checked {{
-            border: 2px solid {colors.PRIMARY};
+
+        {scope}QRadioButton::indicator:checked {{
+            border: 2px solid {primary};
             border-radius: 8px;
-            background-color: {colors.PRIMARY};
+            background-color: {primary};
         }}
-        
-        {button_style}
+
         """
-    
-    @staticmethod
-    def get_main_window_style(theme: str = "dark") -> str:
-        """Возвращает основной стиль для главного окна."""
-        colors = AppConfig.Colors
-        sizes = AppConfig.Sizes
-        
-        if theme == "dark":
-            bg_gradient = f"stop:0 {colors.DARK_BG}, stop:1 {colors.DARK_BG_SECONDARY}"
-            text_color = colors.DARK_TEXT
-            border_color = colors.DARK_BORDER
-            widget_bg = colors.DARK_WIDGET_BG
-            muted_text = colors.DARK_TEXT_MUTED
-        else:
-            bg_gradient = f"stop:0 {colors.LIGHT_BG}, stop:1 {colors.LIGHT_BG_SECONDARY}"
-            text_color = colors.LIGHT_TEXT
-            border_color = colors.LIGHT_BORDER
-            widget_bg = colors.LIGHT_WIDGET_BG
-            muted_text = colors.LIGHT_TEXT_MUTED
-        
-        text_edit_style = StyleManager.get_text_edit_style(theme)
-        button_style = StyleManager.get_button_style("primary")
-        combo_style = StyleManager.get_combo_box_style(theme)
-        
-        return f"""
+
+_MAIN_WINDOW_HEAD_TMPL = """
         QMainWindow {{
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1, {bg_gradient});
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 {bg}, stop:1 {bg_secondary});
             color: {text_color};
         }}
-        
-        {text_edit_style}
-        {button_style}
-        {combo_style}
-        
+
+        """
+
+_MAIN_WINDOW_TAIL_TMPL = """
         QLabel {{
             color: {text_color};
-            font-size: {AppConfig.Fonts.SIZE_MEDIUM}px;
-            font-weight: {AppConfig.Fonts.WEIGHT_BOLD};
+            font-size: {font_medium}px;
+            font-weight: {weight_bold};
         }}
-        
+
         QProgressBar {{
             border: 2px solid {border_color};
-            border-radius: {sizes.BORDER_RADIUS}px;
+            border-radius: {border_radius}px;
             background-color: {widget_bg};
             text-align: center;
-            font-size: {AppConfig.Fonts.SIZE_SMALL}px;
+            font-size: {font_small}px;
             color: {text_color};
         }}
-        
+
         QProgressBar::chunk {{
             background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                stop:0 {colors.PRIMARY}, stop:1 {colors.PRIMARY_PRESSED});
+                stop:0 {primary}, stop:1 {primary_pressed});
             border-radius: 4px;
         }}
-        
-        QGroupBox {{
-            font-size: {AppConfig.Fonts.SIZE_LARGE}px;
-            font-weight: {AppConfig.Fonts.WEIGHT_BOLD};
-            color: {text_color};
-            border: 2px solid {border_color};
-            border-radius: {sizes.BORDER_RADIUS_LARGE}px;
-            margin-top: {sizes.SPACING_SMALL}px;
-            padding-top: {sizes.SPACING_SMALL}px;
-        }}
-        
-        QGroupBox::title {{
-            subcontrol-origin: margin;
-            left: {sizes.SPACING_SMALL}px;
-            padding: 0 {sizes.PADDING_SMALL}px 0 {sizes.PADDING_SMALL}px;
-        }}
-        
+
         QStatusBar {{
-            background-color: {colors.DARK_BG if theme == 'dark' else colors.LIGHT_BG};
+            background-color: {bg};
             color: {text_color};
             border-top: 1px solid {border_color};
         }}
         """
+
+# Параметры подстановки вычисляются один раз при импорте модуля
+_PARAMS_BASE = {
+    "primary": _COLORS.PRIMARY,
+    "primary_pressed": _COLORS.PRIMARY_PRESSED,
+    "border_radius": _SIZES.BORDER_RADIUS,
+    "border_radius_large": _SIZES.BORDER_RADIUS_LARGE,
+    "spacing_small": _SIZES.SPACING_SMALL,
+    "padding_small": _SIZES.PADDING_SMALL,
+    "padding_medium": _SIZES.PADDING_MEDIUM,
+    "padding_large": _SIZES.PADDING_LARGE,
+    "padding_large_x2": _PADDING_LARGE_X2,
+    "font_small": _FONTS.SIZE_SMALL,
+    "font_medium": _FONTS.SIZE_MEDIUM,
+    "font_large": _FONTS.SIZE_LARGE,
+    "weight_bold": _FONTS.WEIGHT_BOLD,
+}
+
+_PARAMS_DARK = {
+    **_PARAMS_BASE,
+    "bg": _COLORS.DARK_BG,
+    "bg_secondary": _COLORS.DARK_BG_SECONDARY,
+    "widget_bg": _COLORS.DARK_WIDGET_BG,
+    "border_color": _COLORS.DARK_BORDER,
+    "text_color": _COLORS.DARK_TEXT,
+    "secondary_text": _COLORS.DARK_TEXT_SECONDARY,
+}
+
+_PARAMS_LIGHT = {
+    **_PARAMS_BASE,
+    "bg": _COLORS.LIGHT_BG,
+    "bg_secondary": _COLORS.LIGHT_BG_SECONDARY,
+    "widget_bg": _COLORS.LIGHT_WIDGET_BG,
+    "border_color": _COLORS.LIGHT_BORDER,
+    "text_color": _COLORS.LIGHT_TEXT,
+    "secondary_text": _COLORS.LIGHT_TEXT_SECONDARY,
+}
+
+_THEME_PALETTE = {
+    "dark": _PARAMS_DARK,
+    "light": _PARAMS_LIGHT,
+}
+
+# Градиенты кнопок собираются один раз при импорте
+_BTN_PRIMARY_BG = f"stop:0 {_COLORS.PRIMARY}, stop:1 {_COLORS.PRIMARY_PRESSED}"
+_BTN_PRIMARY_HOVER = f"stop:0 {_COLORS.PRIMARY_HOVER}, stop:1 {_COLORS.PRIMARY}"
+_BTN_PRIMARY_PRESSED = f"stop:0 {_COLORS.PRIMARY_PRESSED}, stop:1 #2a6aa3"
+
+_BTN_SUCCESS_BG = f"stop:0 {_COLORS.SUCCESS}, stop:1 #1e7e34"
+_BTN_SUCCESS_HOVER = f"stop:0 {_COLORS.SUCCESS_HOVER}, stop:1 {_COLORS.SUCCESS}"
+_BTN_SUCCESS_PRESSED = "stop:0 #1e7e34, stop:1 #155724"
+
+_BTN_DANGER_BG = f"stop:0 {_COLORS.DANGER}, stop:1 #c82333"
+_BTN_DANGER_HOVER = f"stop:0 {_COLORS.DANGER_HOVER}, stop:1 {_COLORS.DANGER}"
+_BTN_DANGER_PRESSED = "stop:0 #c82333, stop:1 #bd2130"
+
+# (обычный, hover, pressed) для каждого типа кнопки
+_BUTTON_PALETTE = {
+    "primary": (_BTN_PRIMARY_BG, _BTN_PRIMARY_HOVER, _BTN_PRIMARY_PRESSED),
+    "success": (_BTN_SUCCESS_BG, _BTN_SUCCESS_HOVER, _BTN_SUCCESS_PRESSED),
+    "danger": (_BTN_DANGER_BG, _BTN_DANGER_HOVER, _BTN_DANGER_PRESSED),
+}
+
+
+def _render_button(color_type: str = "primary", size: str = "normal", scope: str = "") -> str:
+    """Заполняет шаблон кнопки; scope — префикс селектора (например, для диалогов темы)."""
+    bg_color, hover_color, pressed_color = _BUTTON_PALETTE.get(color_type, _BUTTON_PALETTE["primary"])
+    height = _BUTTON_LARGE_HEIGHT if size == "large" else _BUTTON_HEIGHT
+
+    return _BUTTON_TMPL.format(
+        bg_color=bg_color,
+        hover_color=hover_color,
+        pressed_color=pressed_color,
+        height=height,
+        scope=scope,
+        **_PARAMS_BASE
+    )
+
+
+def _scoped_dialog_style(theme: str) -> str:
+    """Возвращает стиль диалогов темы с селекторами по свойству theme."""
+    dialog = f'QDialog[theme="{theme}"]'
+    scope = dialog + " "
+    head = _DIALOG_HEAD_TMPL.format_map({**_THEME_PALETTE.get(theme, _PARAMS_LIGHT), "dialog": dialog, "scope": scope})
+    return head + _render_button("primary", scope=scope)
+
+
+class StyleManager:
+    """Менеджер стилей приложения.
+
+    Тематические стили для всех доступных тем собираются один раз при импорте
+    модуля; для неизвестной темы стиль строится при обращении.
+    """
+
+    @staticmethod
+    def stylesheet_for(widget_kind: str, theme: str = "dark",
+                       color_type: str = "primary", size: str = "normal") -> str:
+        """Возвращает стиль для вида виджета."""
+        if widget_kind == "button":
+            return StyleManager.get_button_style(color_type, size)
+
+        themes = _PRECOMPUTED.get(widget_kind)
+        if themes is None:
+            raise ValueError(f"Неизвестный тип виджета: {widget_kind}")
+
+        style = themes.get(theme)
+        if style is None:
+            style = _THEMED_GETTERS[widget_kind](theme)
+        return style
+
+    @staticmethod
+    def get_button_style(color_type: str = "primary", size: str = "normal") -> str:
+        """Возвращает стиль для кнопок."""
+        return _render_button(color_type, size)
+
+    @staticmethod
+    def get_text_edit_style(theme: str = "dark") -> str:
+        """Возвращает стиль для текстовых полей."""
+        return _TEXT_EDIT_TMPL.format_map(_THEME_PALETTE.get(theme, _PARAMS_LIGHT))
+
+    @staticmethod
+    def get_combo_box_style(theme: str = "dark") -> str:
+        """Возвращает стиль для комбо-боксов."""
+        return _COMBO_BOX_TMPL.format_map(_THEME_PALETTE.get(theme, _PARAMS_LIGHT))
+
+    @staticmethod
+    def get_global_style(theme: str = "dark") -> str:
+        """Возвращает общие правила, устанавливаемые на QApplication."""
+        return _GROUPBOX_TMPL.format_map(_THEME_PALETTE.get(theme, _PARAMS_LIGHT))
+
+    @staticmethod
+    def get_main_window_style(theme: str = "dark") -> str:
+        """Возвращает основной стиль для главного окна."""
+        params = _THEME_PALETTE.get(theme, _PARAMS_LIGHT)
+        return "".join((
+            _MAIN_WINDOW_HEAD_TMPL.format_map(params),
+            StyleManager.get_text_edit_style(theme),
+            _PRIMARY_BUTTON_QSS,
+            StyleManager.get_combo_box_style(theme),
+            _MAIN_WINDOW_TAIL_TMPL.format_map(params),
+        ))
+
+    @staticmethod
+    def get_application_style(theme: str = "dark") -> str:
+        """Возвращает единый лист для QApplication.
+
+        Содержит общие правила для текущей темы и стили диалогов всех тем,
+        выбираемые по свойству theme диалога.
+        """
+        dialogs = "".join(_scoped_dialog_style(name) for name in AppConfig.AVAILABLE_THEMES)
+        return StyleManager.get_global_style(theme) + dialogs
+
+    @staticmethod
+    def install_application_style(app, theme: str):
+        """Устанавливает лист стилей приложения, если он изменился."""
+        sheet = StyleManager.stylesheet_for("application", theme)
+        if app.styleSheet() != sheet:
+            app.setStyleSheet(sheet)
+
+
+# Стиль основной кнопки не зависит от темы и входит во все составные стили
+_PRIMARY_BUTTON_QSS = StyleManager.get_button_style("primary")
+
+# Тематические геттеры, доступные через StyleManager.stylesheet_for
+_THEMED_GETTERS = {
+    "text_edit": StyleManager.get_text_edit_style,
+    "combo_box": StyleManager.get_combo_box_style,
+    "main_window": StyleManager.get_main_window_style,
+    "global": StyleManager.get_global_style,
+    "application": StyleManager.get_application_style,
+}
+
+# Стили для всех доступных тем готовятся при импорте, чтобы переключение
+# темы во время работы сводилось к поиску в словаре
+_PRECOMPUTED = {
+    kind: {theme: getter(theme) for theme in AppConfig.AVAILABLE_THEMES}
+    for kind, getter in _THEMED_GETTERS.items()
+}
@@ -3,22 +3,42 @@ UI компоненты для TTS приложения.
 Содержит переиспользуемые диалоги и виджеты.
 """
 
-import os
+import re
 from typing import Optional, Callable
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QLineEdit, QRadioButton, QDialogButtonBox, QMessageBox,
-    QFileDialog, QTextEdit, QGroupBox, QCheckBox, QScrollArea, QWidget
+    QFileDialog, QTextEdit, QGroupBox, QCheckBox, QScrollArea, QWidget,
+    QApplication
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QIcon
-import qtawesome as qta
+from PyQt6.QtCore import Qt, QTimer, QSignalBlocker, pyqtSignal
+from PyQt6.QtGui import QFont, QIcon, QTextDocument
+from PyQt6 import sip
 
 from config import AppConfig
 from style_manager import StyleManager
 from validation import Validator, ValidationResult
 
 
+# Разделитель списка голосов вместе с окружающими пробелами
+_COMMA_SPLIT = re.compile(r'\s*,\s*')
+
+# Каталог по умолчанию для диалогов сохранения
+_DEFAULT_HOME = str(AppConfig.HOME_DIR)
+
+
+def _apply_dialog_theme(dialog, theme: str):
+    """Помечает диалог темой, стиль для которой берется из листа приложения.
+
+    Если приложение еще не установило свой лист (диалог показан вне главного
+    окна), он устанавливается здесь, чтобы диалог не остался без стиля.
+    """
+    dialog.setProperty("theme", theme)
+    app = QApplication.instance()
+    if app is not None and not app.styleSheet():
+        StyleManager.install_application_style(app, theme)
+
+
 class BaseDialog(QDialog):
     """Базовый класс для всех диалогов."""
     
@@ -32,7 +52,9 @@ class BaseDialog(QDialog):
         self.setWindowTitle(title)
         self.setModal(True)
         self.resize(500, 700)
-        self.setStyleSheet(StyleManager.get_dialog_style(self.theme))
+        # Стиль берется из общего листа приложения по свойству theme,
+        # поэтому при открытии диалога ничего не разбирается заново
+        _apply_dialog_theme(self, self.theme)
     
     def create_button_layout(self, ok_text: str = "OK", cancel_text: str = "Отмена") -> QHBoxLayout:
         """Создает стандартную раскладку кнопок."""
@@ -51,49 +73,63 @@ class BaseDialog(QDialog):
         return layout
 
 
+# Описание в диалоге ввода API ключа
+_API_DESC_TEXT = (
+    "Для работы приложения необходим API ключ от Google Gemini.\n\n"
+    "📋 Как получить API ключ:\n"
+    "1. Перейдите на сайт: https://aistudio.google.com/app/apikey\n"
+    "2. Войдите в свой Google аккаунт\n"
+    "3. Нажмите 'Create API Key'\n"
+    "4. Скопируйте полученный ключ\n\n"
+    "🔒 Ваш ключ будет сохранен безопасно в настройках приложения."
+)
+
+
 class ApiKeyDialog(BaseDialog):
     """Диалог для ввода API ключа."""
     
     def __init__(self, parent=None, theme: str = "dark"):
         super().__init__(parent, "🔑 Настройка API ключа", theme)
         self.api_key = ""
+        
+        # Валидация запускается после паузы в наборе, а не на каждое нажатие
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(150)
+        self._validate_timer.timeout.connect(self.validate_input)
+        
         self.setup_ui()
     
     def setup_ui(self):
         """Настройка интерфейса диалога."""
+        colors = AppConfig.Colors
+        fonts = AppConfig.Fonts
+        sizes = AppConfig.Sizes
+        text_secondary = colors.DARK_TEXT_SECONDARY if self.theme == 'dark' else colors.LIGHT_TEXT_SECONDARY
+        
         layout = QVBoxLayout(self)
-        layout.setSpacing(AppConfig.Sizes.SPACING_MEDIUM)
+        layout.setSpacing(sizes.SPACING_MEDIUM)
         layout.setContentsMargins(
-            AppConfig.Sizes.SPACING_LARGE, AppConfig.Sizes.SPACING_LARGE,
-            AppConfig.Sizes.SPACING_LARGE, AppConfig.Sizes.SPACING_LARGE
+            sizes.SPACING_LARGE, sizes.SPACING_LARGE,
+            sizes.SPACING_LARGE, sizes.SPACING_LARGE
         )
         
         # Заголовок
         title_label = QLabel("🔑 Настройка Gemini API ключа")
         title_label.setStyleSheet(f"""
-            font-size: {AppConfig.Fonts.SIZE_TITLE}px; 
-            font-weight: {AppConfig.Fonts.WEIGHT_BOLD}; 
-            color: {AppConfig.Colors.PRIMARY}; 
-            margin-bottom: {AppConfig.Sizes.SPACING_SMALL}px;
+            font-size: {fonts.SIZE_TITLE}px; 
+            font-weight: {fonts.WEIGHT_BOLD}; 
+            color: {colors.PRIMARY}; 
+            margin-bottom: {sizes.SPACING_SMALL}px;
         """)
         layout.addWidget(title_label)
         
         # Описание
-        desc_text = (
-            "Для работы приложения необходим API ключ от Google Gemini.\n\n"
-            "📋 Как получить API ключ:\n"
-            "1. Перейдите на сайт: https://aistudio.google.com/app/apikey\n"
-            "2. Войдите в свой Google аккаунт\n"
-            "3. Нажмите 'Create API Key'\n"
-            "4. Скопируйте полученный ключ\n\n"
-            "🔒 Ваш ключ будет сохранен безопасно в настройках приложения."
-        )
-        
-        desc_label = QLabel(desc_text)
+        desc_label = QLabel(_API_DESC_TEXT)
         desc_label.setWordWrap(True)
         desc_label.setStyleSheet(f"""
-            color: {AppConfig.Colors.DARK_TEXT_SECONDARY if self.theme == 'dark' else AppConfig.Colors.LIGHT_TEXT_SECONDARY}; 
-            font-size: {AppConfig.Fonts.SIZE_SMALL}px; 
+            color: {text_secondary}; 
+            font-size: {fonts.SIZE_SMALL}px; 
             line-height: 1.5;
         """)
         layout.addWidget(desc_label)
@@ -105,14 +141,19 @@ class ApiKeyDialog(BaseDialog):
         self.api_key_input = QLineEdit()
         self.api_key_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.api_key_input.setPlaceholderText("AIzaSy...")
-        self.api_key_input.textChanged.connect(self.validate_input)
+        self.api_key_input.textChanged.connect(lambda _: self._validate_timer.start())
         layout.addWidget(self.api_key_input)
         
         # Статус валидации
         self.validation_label = QLabel("")
-        self.validation_label.setStyleSheet(f"font-size: {AppConfig.Fonts.SIZE_SMALL}px;")
+        self.validation_label.setStyleSheet(f"font-size: {fonts.SIZE_SMALL}px;")
         layout.addWidget(self.validation_label)
         
+        # Стили статуса готовятся заранее и применяются только при смене состояния
+        self._ok_style = f"color: {colors.SUCCESS}; font-size: {fonts.SIZE_SMALL}px;"
+        self._err_style = f"color: {colors.DANGER}; font-size: {fonts.SIZE_SMALL}px;"
+        self._last_state = None
+        
         # Кнопки
         buttons_layout = self.create_button_layout("✅ Сохранить", "❌ Отмена")
         layout.addLayout(buttons_layout)
@@ -128,23 +169,169 @@ class ApiKeyDialog(BaseDialog):
             self.validation_label.setText("")
             self.ok_button.setEnabled(False)
             return
-        
+
         validation = Validator.validate_api_key(api_key)
         
         if validation.is_valid:
-            self.validation_label.setText("✅ API ключ корректен")
-            self.validation_label.setStyleSheet(f"color: {AppConfig.Colors.SUCCESS}; font-size: {AppConfig.Fonts.SIZE_SMALL}px;")
-            self.ok_button.setEnabled(True)
+            self._set_validation_state(True, "✅ API ключ корректен")
         else:
-            self.validation_label.setText(f"❌ {validation.message}")
-            self.validation_label.setStyleSheet(f"color: {AppConfig.Colors.DANGER}; font-size: {AppConfig.Fonts.SIZE_SMALL}px;")
-            self.ok_button.setEnabled(False)
+            self._set_validation_state(False, f"❌ {validation.message}")
+    
+    def _set_validation_state(self, is_valid: bool, text: str):
+        """Обновляет статус валидации, меняя стиль только при смене состояния."""
+        self.validation_label.setText(text)
+        if is_valid != self._last_state:
+            self.validation_label.setStyleSheet(self._ok_style if is_valid else self._err_style)
+            self._last_state = is_valid
+        self.ok_button.setEnabled(is_valid)
+    
+    def accept(self):
+        """Подтверждает ввод, досрочно выполняя отложенную валидацию."""
+        if self._validate_timer.isActive():
+            self._validate_timer.stop()
+            self.validate_input()
+        if not self.ok_button.isEnabled():
+            return
+        super().accept()
     
     def get_api_key(self) -> str:
         """Возвращает введенный API ключ."""
         return self.api_key_input.text().strip()
 
 
+def _build_settings_styles(theme: str) -> dict:
+    """Собирает стили виджетов SettingsDialog для указанной темы."""
+    colors = AppConfig.Colors
+    dark = theme == 'dark'
+
+    bg = colors.DARK_BG if dark else colors.LIGHT_BG
+    widget_bg = colors.DARK_WIDGET_BG if dark else colors.LIGHT_WIDGET_BG
+    text = colors.DARK_TEXT if dark else colors.LIGHT_TEXT
+    text_secondary = colors.DARK_TEXT_SECONDARY if dark else colors.LIGHT_TEXT_SECONDARY
+
+    return {
+        'scroll': f"""
+            QScrollArea {{
+                background-color: {bg};
+                border: none;
+            }}
+            QScrollBar:vertical {{
+                background-color: {widget_bg};
+                width: 12px;
+                border-radius: 6px;
+            }}
+            QScrollBar::handle:vertical {{
+                background-color: {text_secondary};
+                border-radius: 6px;
+                min-height: 20px;
+            }}
+            QScrollBar::handle:vertical:hover {{
+                background-color: {text};
+            }}
+        """,
+        # Все стили содержимого задаются одним листом на content_widget,
+        # отдельные виджеты выбираются по objectName
+        'content': f"""
+            QWidget {{
+                background-color: {bg};
+            }}
+            #statusOk {{
+                color: {colors.SUCCESS};
+                font-weight: bold;
+                font-size: {AppConfig.Fonts.SIZE_NORMAL}px;
+            }}
+            #statusError {{
+                color: {colors.DANGER};
+                font-weight: bold;
+                font-size: {AppConfig.Fonts.SIZE_NORMAL}px;
+            }}
+            #primaryBtn {{
+                background-color: {colors.PRIMARY};
+                color: white;
+                border: none;
+                padding: 8px 16px;
+                border-radius: 6px;
+                font-weight: bold;
+                min-height: {AppConfig.Sizes.BUTTON_MIN_HEIGHT}px;
+            }}
+            #primaryBtn:hover {{
+                background-color: {colors.PRIMARY_HOVER};
+            }}
+            #primaryBtn:pressed {{
+                background-color: {colors.PRIMARY_PRESSED};
+            }}
+            #dangerBtn {{
+                background-color: {colors.DANGER};
+                color: white;
+                border: none;
+                padding: 8px 16px;
+                border-radius: 6px;
+                font-weight: bold;
+                min-height: {AppConfig.Sizes.BUTTON_MIN_HEIGHT}px;
+            }}
+            #dangerBtn:hover {{
+                background-color: {colors.DANGER_HOVER};
+            }}
+            #dangerBtn:pressed {{
+                background-color: #c82333;
+            }}
+            #hintLabel {{
+                color: {text_secondary};
+                font-size: {AppConfig.Fonts.SIZE_SMALL}px;
+                font-style: italic;
+            }}
+            #themedCheck {{
+                color: {'white' if dark else 'black'};
+            }}
+        """,
+    }
+
+
+# Стили SettingsDialog вычисляются один раз при импорте модуля
+_STYLE_TABLES = {theme: _build_settings_styles(theme) for theme in AppConfig.AVAILABLE_THEMES}
+
+
+# Декларативное описание групп SettingsDialog:
+# (заголовок, ((вид, атрибут, текст, геттер SettingsManager, параметры), ...))
+_SETTINGS_SCHEMA = (
+    ("🔧 Дополнительные настройки", (
+        ("check", "auto_play_checkbox", "🎵 Автовоспроизведение после генерации", None, {}),
+        ("check", "save_window_pos_checkbox", "💾 Сохранять позицию окна", None, {'default': True}),
+    )),
+    ("💬 Разделитель голосов", (
+        ("check", "delimiter_enabled_checkbox", "Включить переключение голосов по разделителю",
+         "get_delimiter_enabled", {}),
+        ("line", "delimiter_string_input", "Строка-разделитель:",
+         "get_delimiter_string", {'placeholder': AppConfig.DEFAULT_VOICE_DELIMITER}),
+        ("line", "delimiter_voices_input", "Последовательность голосов (через запятую):",
+         "get_delimiter_voice_sequence", {'placeholder': "Kore, Puck, Nova"}),
+    )),
+    ("🎙️ Настройки TTS", (
+        ("check", "native_multispeaker_checkbox", "Нативная генерация (только 2 голоса)",
+         "get_use_native_multispeaker", {
+             'tooltip': (
+                 "Использует встроенную поддержку мультиспикеров Gemini API.\n"
+                 "• Быстрее и качественнее для 2 спикеров\n"
+                 "• При ошибке автоматически переключается на обычную генерацию\n"
+                 "• Работает только с тегами голосов [voice:Name]...[/voice]"
+             ),
+         }),
+    )),
+)
+
+_INFO_APPLY = "💡 Изменения применятся сразу после нажатия OK"
+
+# Подпись о шифровании: (криптография доступна, шифрование включено) -> текст
+_CRYPTO_INFO = {
+    (crypto_available, encryption_enabled): (
+        f"🔒 Шифрование: {'Включено' if encryption_enabled else 'Отключено'}"
+        + ("" if crypto_available else "\n⚠️ Для повышения безопасности установите: pip install cryptography")
+    )
+    for crypto_available in (True, False)
+    for encryption_enabled in (True, False)
+}
+
+
 class SettingsDialog(BaseDialog):
     """Диалог настроек приложения."""
     
@@ -157,6 +344,8 @@ class SettingsDialog(BaseDialog):
         self.current_theme = current_theme
         self.settings_manager = settings_manager
         self.encryption_status = encryption_status or {}
+        # Последняя разобранная строка голосов и результат ее разбора
+        self._voices_cache: Optional[tuple] = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -171,221 +360,135 @@ class SettingsDialog(BaseDialog):
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
 
+        sizes = AppConfig.Sizes
+        styles = _STYLE_TABLES.get(self.current_theme, _STYLE_TABLES['light'])
+
         # Применяем стили к прокручиваемой области
-        scroll_area.setStyleSheet(f"""
-            QScrollArea {{
-                background-color: {AppConfig.Colors.DARK_BG if self.current_theme == 'dark' else AppConfig.Colors.LIGHT_BG};
-                border: none;
-            }}
-            QScrollBar:vertical {{
-                background-color: {AppConfig.Colors.DARK_WIDGET_BG if self.current_theme == 'dark' else AppConfig.Colors.LIGHT_WIDGET_BG};
-                width: 12px;
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {AppConfig.Colors.DARK_TEXT_SECONDARY if self.current_theme == 'dark' else AppConfig.Colors.LIGHT_TEXT_SECONDARY};
-                border-radius: 6px;
-                min-height: 20px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {AppConfig.Colors.DARK_TEXT if self.current_theme == 'dark' else AppConfig.Colors.LIGHT_TEXT};
-            }}
-        """)
+        scroll_area.setStyleSheet(styles['scroll'])
 
         # Создаем виджет для содержимого
         content_widget = QWidget()
-        content_widget.setStyleSheet(f"""
-            QWidget {{
-                background-color: {AppConfig.Colors.DARK_BG if self.current_theme == 'dark' else AppConfig.Colors.LIGHT_BG};
-            }}
-        """)
+        content_widget.setStyleSheet(styles['content'])
 
         layout = QVBoxLayout(content_widget)
-        layout.setSpacing(AppConfig.Sizes.SPACING_MEDIUM)
+        layout.setSpacing(sizes.SPACING_MEDIUM)
         layout.setContentsMargins(
-            AppConfig.Sizes.SPACING_LARGE, AppConfig.Sizes.SPACING_LARGE,
-            AppConfig.Sizes.SPACING_LARGE, AppConfig.Sizes.SPACING_LARGE
+            sizes.SPACING_LARGE, sizes.SPACING_LARGE,
+            sizes.SPACING_LARGE, sizes.SPACING_LARGE
         )
-        
-        # Выбор темы
+
+        layout.addWidget(self._build_theme_group())
+        layout.addWidget(self._build_api_group())
+
+        # Группы флажков и полей строятся по декларативной схеме
+        for title, items in _SETTINGS_SCHEMA:
+            layout.addWidget(self._build_group(title, items))
+
+        info_label = QLabel(_INFO_APPLY)
+        info_label.setObjectName("hintLabel")
+        layout.addWidget(info_label)
+
+        # Устанавливаем содержимое в прокручиваемую область
+        scroll_area.setWidget(content_widget)
+        main_layout.addWidget(scroll_area)
+
+        # Добавляем кнопки вне прокручиваемой области
+        buttons_layout = self.create_button_layout()
+        main_layout.addLayout(buttons_layout)
+
+        # Устанавливаем максимальную высоту окна
+        self.setMaximumHeight(600)  # Ограничиваем высоту окна
+
+    def _build_theme_group(self) -> QGroupBox:
+        """Строит группу выбора темы."""
+        sizes = AppConfig.Sizes
+
         theme_group = QGroupBox("🎨 Тема оформления")
         theme_layout = QVBoxLayout(theme_group)
-        theme_layout.setSpacing(AppConfig.Sizes.SPACING_SMALL)
+        theme_layout.setSpacing(sizes.SPACING_SMALL)
         
         self.dark_theme_radio = QRadioButton("🌙 Темная тема")
         self.light_theme_radio = QRadioButton("☀️ Светлая тема")
         
-        if self.current_theme == 'dark':
-            self.dark_theme_radio.setChecked(True)
-        else:
-            self.light_theme_radio.setChecked(True)
+        selected = self.dark_theme_radio if self.current_theme == 'dark' else self.light_theme_radio
+        with QSignalBlocker(selected):
+            selected.setChecked(True)
         
         theme_layout.addWidget(self.dark_theme_radio)
         theme_layout.addWidget(self.light_theme_radio)
-        layout.addWidget(theme_group)
-        
-        # Управление API ключом
+        return theme_group
+
+    def _build_api_group(self) -> QGroupBox:
+        """Строит группу управления API ключом."""
+        sizes = AppConfig.Sizes
+
         api_group = QGroupBox("🔑 Управление API ключом")
         api_layout = QVBoxLayout(api_group)
-        api_layout.setSpacing(AppConfig.Sizes.SPACING_SMALL)
+        api_layout.setSpacing(sizes.SPACING_SMALL)
         
         if self.encryption_status.get('has_saved_key'):
-            status_text = "✅ API ключ сохранен"
-            status_color = AppConfig.Colors.SUCCESS
+            status_label = QLabel("✅ API ключ сохранен")
+            status_label.setObjectName("statusOk")
         else:
-            status_text = "❌ API ключ не настроен"
-            status_color = AppConfig.Colors.DANGER
-        
-        status_label = QLabel(status_text)
-        status_label.setStyleSheet(f"color: {status_color}; font-weight: bold; font-size: {AppConfig.Fonts.SIZE_NORMAL}px;")
+            status_label = QLabel("❌ API ключ не настроен")
+            status_label.setObjectName("statusError")
         api_layout.addWidget(status_label)
         
         api_buttons_layout = QHBoxLayout()
         
         change_key_button = QPushButton("🔄 Изменить ключ")
         change_key_button.clicked.connect(self.change_api_key_requested.emit)
-        change_key_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {AppConfig.Colors.PRIMARY};
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-                min-height: {AppConfig.Sizes.BUTTON_MIN_HEIGHT}px;
-            }}
-            QPushButton:hover {{
-                background-color: {AppConfig.Colors.PRIMARY_HOVER};
-            }}
-            QPushButton:pressed {{
-                background-color: {AppConfig.Colors.PRIMARY_PRESSED};
-            }}
-        """)
+        change_key_button.setObjectName("primaryBtn")
         api_buttons_layout.addWidget(change_key_button)
         
         if self.encryption_status.get('has_saved_key'):
             remove_key_button = QPushButton("🗑️ Удалить ключ")
             remove_key_button.clicked.connect(self.remove_api_key_requested.emit)
-            remove_key_button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {AppConfig.Colors.DANGER};
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 6px;
-                    font-weight: bold;
-                    min-height: {AppConfig.Sizes.BUTTON_MIN_HEIGHT}px;
-                }}
-                QPushButton:hover {{
-                    background-color: {AppConfig.Colors.DANGER_HOVER};
-                }}
-                QPushButton:pressed {{
-                    background-color: #c82333;
-                }}
-            """)
+            remove_key_button.setObjectName("dangerBtn")
             api_buttons_layout.addWidget(remove_key_button)
         
         api_layout.addLayout(api_buttons_layout)
         
-        crypto_info = f"🔒 Шифрование: {'Включено' if self.encryption_status.get('encryption_enabled') else 'Отключено'}"
-        if not self.encryption_status.get('crypto_available'):
-            crypto_info += "\n⚠️ Для повышения безопасности установите: pip install cryptography"
-        
-        crypto_label = QLabel(crypto_info)
-        crypto_label.setStyleSheet(f"""
-            color: {AppConfig.Colors.DARK_TEXT_SECONDARY if self.current_theme == 'dark' else AppConfig.Colors.LIGHT_TEXT_SECONDARY}; 
-            font-size: {AppConfig.Fonts.SIZE_SMALL}px; 
-            font-style: italic;
-        """)
+        crypto_label = QLabel(_CRYPTO_INFO[
+            bool(self.encryption_status.get('crypto_available')),
+            bool(self.encryption_status.get('encryption_enabled')),
+        ])
+        crypto_label.setObjectName("hintLabel")
         api_layout.addWidget(crypto_label)
-        
-        layout.addWidget(api_group)
-        
-        # Дополнительные настройки
-        additional_group = QGroupBox("🔧 Дополнительные настройки")
-        additional_layout = QVBoxLayout(additional_group)
-
-        self.auto_play_checkbox = QCheckBox("🎵 Автовоспроизведение после генерации")
-        self.save_window_pos_checkbox = QCheckBox("💾 Сохранять позицию окна")
-        self.save_window_pos_checkbox.setChecked(True)
-
-        if self.current_theme == 'dark':
-            checkbox_style = "color: white;"
-        else:
-            checkbox_style = "color: black;"
-        self.auto_play_checkbox.setStyleSheet(checkbox_style)
-        self.save_window_pos_checkbox.setStyleSheet(checkbox_style)
-
-        additional_layout.addWidget(self.auto_play_checkbox)
-        additional_layout.addWidget(self.save_window_pos_checkbox)
-        layout.addWidget(additional_group)
-
-        # Настройки разделителя голосов
-        delimiter_group = QGroupBox("💬 Разделитель голосов")
-        delimiter_layout = QVBoxLayout(delimiter_group)
-
-        self.delimiter_enabled_checkbox = QCheckBox("Включить переключение голосов по разделителю")
-        if self.settings_manager:
-            self.delimiter_enabled_checkbox.setChecked(self.settings_manager.get_delimiter_enabled())
-        self.delimiter_enabled_checkbox.setStyleSheet(checkbox_style)
-        delimiter_layout.addWidget(self.delimiter_enabled_checkbox)
-
-        delimiter_string_layout = QHBoxLayout()
-        delimiter_string_layout.addWidget(QLabel("Строка-разделитель:"))
-        self.delimiter_string_input = QLineEdit()
-        self.delimiter_string_input.setPlaceholderText(AppConfig.DEFAULT_VOICE_DELIMITER)
-        if self.settings_manager:
-            self.delimiter_string_input.setText(self.settings_manager.get_delimiter_string())
-        delimiter_string_layout.addWidget(self.delimiter_string_input)
-        delimiter_layout.addLayout(delimiter_string_layout)
-
-        delimiter_voices_layout = QHBoxLayout()
-        delimiter_voices_layout.addWidget(QLabel("Последовательность голосов (через запятую):"))
-        self.delimiter_voices_input = QLineEdit()
-        self.delimiter_voices_input.setPlaceholderText("Kore, Puck, Nova")
-        if self.settings_manager:
-            self.delimiter_voices_input.setText(", ".join(self.settings_manager.get_delimiter_voice_sequence()))
-        delimiter_voices_layout.addWidget(self.delimiter_voices_input)
-        delimiter_layout.addLayout(delimiter_voices_layout)
-
-        layout.addWidget(delimiter_group)
-
-        # Настройки TTS
-        tts_group = QGroupBox("🎙️ Настройки TTS")
-        tts_layout = QVBoxLayout(tts_group)
-
-        self.native_multispeaker_checkbox = QCheckBox("Нативная генерация (только 2 голоса)")
-        self.native_multispeaker_checkbox.setToolTip(
-            "Использует встроенную поддержку мультиспикеров Gemini API.\n"
-            "• Быстрее и качественнее для 2 спикеров\n"
-            "• При ошибке автоматически переключается на обычную генерацию\n"
-            "• Работает только с тегами голосов [voice:Name]...[/voice]"
-        )
-        if self.settings_manager:
-            self.native_multispeaker_checkbox.setChecked(self.settings_manager.get_use_native_multispeaker())
-        self.native_multispeaker_checkbox.setStyleSheet(checkbox_style)
-        tts_layout.addWidget(self.native_multispeaker_checkbox)
-
-        layout.addWidget(tts_group)
-
-        info_label = QLabel("💡 Изменения применятся сразу после нажатия OK")
-        info_label.setStyleSheet(f"""
-            color: {AppConfig.Colors.DARK_TEXT_SECONDARY if self.current_theme == 'dark' else AppConfig.Colors.LIGHT_TEXT_SECONDARY}; 
-            font-size: {AppConfig.Fonts.SIZE_SMALL}px; 
-            font-style: italic;
-        """)
-        layout.addWidget(info_label)
-
-        # Устанавливаем содержимое в прокручиваемую область
-        scroll_area.setWidget(content_widget)
-        main_layout.addWidget(scroll_area)
-
-        # Добавляем кнопки вне прокручиваемой области
-        buttons_layout = self.create_button_layout()
-        main_layout.addLayout(buttons_layout)
-
-        # Устанавливаем максимальную высоту окна
-        self.setMaximumHeight(600)  # Ограничиваем высоту окна
+        return api_group
+
+    def _build_group(self, title: str, items: tuple) -> QGroupBox:
+        """Строит группу настроек по описанию из _SETTINGS_SCHEMA."""
+        group = QGroupBox(title)
+        group_layout = QVBoxLayout(group)
+
+        for kind, attr, text, setting, options in items:
+            value = getattr(self.settings_manager, setting)() if self.settings_manager and setting else None
+
+            if kind == "check":
+                widget = QCheckBox(text)
+                if 'tooltip' in options:
+                    widget.setToolTip(options['tooltip'])
+                if value is None:
+                    value = options.get('default')
+                if value is not None:
+                    with QSignalBlocker(widget):
+                        widget.setChecked(value)
+                widget.setObjectName("themedCheck")
+                group_layout.addWidget(widget)
+            else:
+                widget = QLineEdit()
+                widget.setPlaceholderText(options['placeholder'])
+                if value is not None:
+                    widget.setText(", ".join(value) if isinstance(value, list) else value)
+                row_layout = QHBoxLayout()
+                row_layout.addWidget(QLabel(text))
+                row_layout.addWidget(widget)
+                group_layout.addLayout(row_layout)
+
+            setattr(self, attr, widget)
+
+        return group
     
     def get_selected_theme(self) -> str:
         return "dark" if self.dark_theme_radio.isChecked() else "light"
@@ -403,45 +506,18 @@ class SettingsDialog(BaseDialog):
         return self.delimiter_string_input.text().strip()
 
     def get_delimiter_voice_sequence(self) -> list[str]:
-        voices_str = self.delimiter_voices_input.text().strip()
-        if voices_str:
-            return [v.strip() for v in voices_str.split(',') if v.strip()]
-        return []
+        raw = self.delimiter_voices_input.text()
+        if self._voices_cache is None or self._voices_cache[0] != raw:
+            voices_str = raw.strip()
+            parsed = tuple(v for v in _COMMA_SPLIT.split(voices_str) if v) if voices_str else ()
+            self._voices_cache = (raw, parsed)
+        return list(self._voices_cache[1])
 
     def get_use_native_multispeaker(self) -> bool:
         return self.native_multispeaker_checkbox.isChecked()
 
 
-class FormatInfoDialog(BaseDialog):
-    """Диалог с информацией о форматах."""
-    
-    def __init__(self, parent=None, theme: str = "dark"):
-        super().__init__(parent, "📄 Информация о форматах", theme)
-        self.setup_ui()
-    
-    def setup_ui(self):
-        """Настройка интерфейса диалога."""
-        self.resize(500, 400)
-        
-        layout = QVBoxLayout(self)
-        layout.setSpacing(AppConfig.Sizes.SPACING_MEDIUM)
-        layout.setContentsMargins(
-            AppConfig.Sizes.SPACING_LARGE, AppConfig.Sizes.SPACING_LARGE,
-            AppConfig.Sizes.SPACING_LARGE, AppConfig.Sizes.SPACING_LARGE
-        )
-        
-        # Заголовок
-        title_label = QLabel("📄 Поддерживаемые форматы аудио")
-        title_label.setStyleSheet(f"""
-            font-size: {AppConfig.Fonts.SIZE_TITLE}px; 
-            font-weight: {AppConfig.Fonts.WEIGHT_BOLD}; 
-            color: {AppConfig.Colors.PRIMARY}; 
-            margin-bottom: {AppConfig.Sizes.SPACING_SMALL}px;
-        """)
-        layout.addWidget(title_label)
-        
-        # Информация о форматах
-        format_info = """
+_FORMAT_INFO_HTML = """
 <h3>🎵 WAV (Waveform Audio File Format)</h3>
 <ul>
 <li><b>Качество:</b> Без потерь, максимальное качество</li>
@@ -472,10 +548,50 @@ class FormatInfoDialog(BaseDialog):
 <li>Для сохранения на компьютере используйте <b>WAV</b></li>
 <li>MP3 файлы автоматически оптимизируются для мобильных устройств</li>
 </ul>
-        """
+"""
+
+
+class FormatInfoDialog(BaseDialog):
+    """Диалог с информацией о форматах."""
+    
+    # Общий разобранный HTML-документ для всех экземпляров диалога
+    _INFO_DOCUMENT = None
+    
+    def __init__(self, parent=None, theme: str = "dark"):
+        super().__init__(parent, "📄 Информация о форматах", theme)
+        self.setup_ui()
+    
+    def setup_ui(self):
+        """Настройка интерфейса диалога."""
+        self.resize(500, 400)
+        fonts = AppConfig.Fonts
+        sizes = AppConfig.Sizes
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(sizes.SPACING_MEDIUM)
+        layout.setContentsMargins(
+            sizes.SPACING_LARGE, sizes.SPACING_LARGE,
+            sizes.SPACING_LARGE, sizes.SPACING_LARGE
+        )
+        
+        # Заголовок
+        title_label = QLabel("📄 Поддерживаемые форматы аудио")
+        title_label.setStyleSheet(f"""
+            font-size: {fonts.SIZE_TITLE}px; 
+            font-weight: {fonts.WEIGHT_BOLD}; 
+            color: {AppConfig.Colors.PRIMARY}; 
+            margin-bottom: {sizes.SPACING_SMALL}px;
+        """)
+        layout.addWidget(title_label)
+        
+        # Информация о форматах: документ разбирается один раз и переиспользуется
+        if FormatInfoDialog._INFO_DOCUMENT is None:
+            document = QTextDocument()
+            document.setHtml(_FORMAT_INFO_HTML)
+            FormatInfoDialog._INFO_DOCUMENT = document
         
         info_text = QTextEdit()
-        info_text.setHtml(format_info)
+        info_text.setDocument(FormatInfoDialog._INFO_DOCUMENT)
         info_text.setReadOnly(True)
         layout.addWidget(info_text)
         
@@ -488,6 +604,9 @@ class FormatInfoDialog(BaseDialog):
 class StyledMessageBox:
     """Стилизованные сообщения."""
     
+    # Иконка успеха рендерится один раз при первом показе
+    _SUCCESS_PIXMAP = None
+    
     @staticmethod
     def show_info(parent, title: str, message: str, theme: str = "dark"):
         """Показывает информационное сообщение."""
@@ -495,7 +614,7 @@ class StyledMessageBox:
         msg_box.setWindowTitle(title)
         msg_box.setText(message)
         msg_box.setIcon(QMessageBox.Icon.Information)
-        msg_box.setStyleSheet(StyleManager.get_dialog_style(theme))
+        _apply_dialog_theme(msg_box, theme)
         return msg_box.exec()
     
     @staticmethod
@@ -505,7 +624,7 @@ class StyledMessageBox:
         msg_box.setWindowTitle(title)
         msg_box.setText(message)
         msg_box.setIcon(QMessageBox.Icon.Warning)
-        msg_box.setStyleSheet(StyleManager.get_dialog_style(theme))
+        _apply_dialog_theme(msg_box, theme)
         return msg_box.exec()
 
     @staticmethod
@@ -517,7 +636,7 @@ class StyledMessageBox:
         msg_box.setIcon(QMessageBox.Icon.Question)
         msg_box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         msg_box.setDefaultButton(QMessageBox.StandardButton.No)  # По умолчанию "Нет" для безопасности
-        msg_box.setStyleSheet(StyleManager.get_dialog_style(theme))
+        _apply_dialog_theme(msg_box, theme)
         return msg_box.exec()
     
     @staticmethod
@@ -527,11 +646,11 @@ class StyledMessageBox:
         msg_box.setWindowTitle(title)
         msg_box.setText(message)
         msg_box.setIcon(QMessageBox.Icon.Critical)
-        msg_box.setStyleSheet(StyleManager.get_dialog_style(theme))
+        _apply_dialog_theme(msg_box, theme)
         return msg_box.exec()
     
-    @staticmethod
-    def show_success(parent, title: str, message: str, theme: str = "dark"):
+    @classmethod
+    def show_success(cls, parent, title: str, message: str, theme: str = "dark"):
         """Показывает сообщение об успехе."""
         msg_box = QMessageBox(parent)
         msg_box.setWindowTitle(title)
@@ -539,28 +658,48 @@ class StyledMessageBox:
         msg_box.setIcon(QMessageBox.Icon.Information)
         
         # Кастомная иконка для успеха
-        msg_box.setIconPixmap(qta.icon('fa5s.check-circle', color=AppConfig.Colors.SUCCESS).pixmap(64, 64))
-        msg_box.setStyleSheet(StyleManager.get_dialog_style(theme))
+        if cls._SUCCESS_PIXMAP is None:
+            import qtawesome as qta  # загружается только при первом показе
+            cls._SUCCESS_PIXMAP = qta.icon('fa5s.check-circle', color=AppConfig.Colors.SUCCESS).pixmap(64, 64)
+        msg_box.setIconPixmap(cls._SUCCESS_PIXMAP)
+        _apply_dialog_theme(msg_box, theme)
         return msg_box.exec()
 
 
 class FileDialogHelper:
     """Помощник для работы с диалогами файлов."""
     
-    @staticmethod
-    def get_save_file_dialog(parent, title: str, default_filename: str, 
+    # Диалог сохранения создается один раз и переиспользуется между вызовами
+    _INSTANCE: Optional[QFileDialog] = None
+    
+    @classmethod
+    def _get_save_dialog(cls, parent) -> QFileDialog:
+        """Возвращает общий диалог сохранения для указанного родителя."""
+        dialog = cls._INSTANCE
+        if dialog is None or sip.isdeleted(dialog) or dialog.parent() is not parent:
+            dialog = QFileDialog(parent)
+            dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+            dialog.setFileMode(QFileDialog.FileMode.AnyFile)
+            cls._INSTANCE = dialog
+        return dialog
+    
+    @classmethod
+    def get_save_file_dialog(cls, parent, title: str, default_filename: str, 
                            file_filter: str, last_directory: str = "") -> tuple:
         """Показывает диалог сохранения файла."""
         if not last_directory:
-            last_directory = str(AppConfig.HOME_DIR)
+            last_directory = _DEFAULT_HOME
         
-        default_path = os.path.join(last_directory, default_filename)
+        dialog = cls._get_save_dialog(parent)
+        dialog.setWindowTitle(title)
+        dialog.setNameFilters(file_filter.split(';;'))
+        dialog.setDirectory(last_directory)
+        dialog.selectFile(default_filename)
         
-        file_path, selected_filter = QFileDialog.getSaveFileName(
-            parent, title, default_path, file_filter
-        )
+        if dialog.exec() != QFileDialog.DialogCode.Accepted:
+            return "", ""
         
-        return file_path, selected_filter
+        return dialog.selectedFiles()[0], dialog.selectedNameFilter()
     
     @staticmethod
     def get_audio_save_dialog(parent, has_pydub: bool = True, 
@@ -3,20 +3,166 @@
 Содержит все функции проверки данных.
 """
 
+import os
 import re
+import string
+from collections import Counter
+from functools import lru_cache
 from typing import Tuple, Optional
 from config import AppConfig
 
 
+# Регулярные выражения компилируются один раз при импорте модуля.
+# Разрешаем буквы, цифры, пробелы и основные знаки препинания,
+# а также символы, необходимые для тегов голоса: [], : /
+_TEXT_DISALLOWED_RE = re.compile(r'[^/\w\s\.,!?;:\-\(\)\"\'«»\n\r\[\]]', re.UNICODE)
+_FILENAME_BAD = frozenset('<>:"|?*')
+# Недопустимые символы и подчеркивания превращаются в пробелы, после чего
+# str.split() схлопывает их вместе с пробельными символами
+_SANITIZE_TABLE = str.maketrans({c: ' ' for c in '<>:"|?*_'})
+# Предложения перебираются по одному, без построения списка всех предложений
+_SENTENCE_RE = re.compile(r'[^.!?]+')
+_PUNCT_RE = re.compile(r'[.!?]')
+_LETTER_RE = re.compile(r'[а-яёa-z]', re.IGNORECASE)
+
+# Для чисто ASCII текста str.translate удаляет все разрешенные символы быстрее
+# регулярного выражения; непустой остаток означает недопустимый символ.
+# Набор строится самим выражением, поэтому результат проверки не меняется.
+# Для не-ASCII текста (в том числе кириллицы) translate медленнее, там
+# используется только выражение.
+_ASCII_ALLOWED = ''.join(
+    chr(code) for code in range(128) if not _TEXT_DISALLOWED_RE.match(chr(code))
+)
+_ASCII_DELETE_TABLE = str.maketrans('', '', _ASCII_ALLOWED)
+
+# Допустимые символы API ключа
+_APIKEY_ALPHABET = frozenset(string.ascii_letters + string.digits + '_-')
+
+# Наборы допустимых голосов и тем для проверки за O(1)
+_VOICES_SET = frozenset(AppConfig.VOICES)
+_THEMES_SET = frozenset(AppConfig.AVAILABLE_THEMES)
+_VOICES_PREVIEW = ', '.join(AppConfig.VOICES[:5])
+_THEMES_STR = ', '.join(AppConfig.AVAILABLE_THEMES)
+
+# Поддерживаемые форматы аудио
+_AUDIO_FORMATS = ('wav', 'mp3')
+_AUDIO_FORMATS_SET = frozenset(_AUDIO_FORMATS)
+_AUDIO_FORMATS_STR = ', '.join(_AUDIO_FORMATS)
+
+
 class ValidationResult:
     """Результат валидации."""
     
+    __slots__ = ('is_valid', 'message')
+    
     def __init__(self, is_valid: bool, message: str = ""):
-        self.is_valid = is_valid
-        self.message = message
+        object.__setattr__(self, 'is_valid', is_valid)
+        object.__setattr__(self, 'message', message)
+    
+    def __setattr__(self, name, value):
+        # Успешные результаты разделяются между вызовами, поэтому менять их нельзя
+        raise AttributeError(f"ValidationResult неизменяем: нельзя изменить '{name}'")
+    
+    def __delattr__(self, name):
+        raise AttributeError(f"ValidationResult неизменяем: нельзя удалить '{name}'")
+    
+    def __reduce__(self):
+        # copy, deepcopy и pickle создают объект через конструктор, а не через setattr
+        return ValidationResult, (self.is_valid, self.message)
     
     def __bool__(self) -> bool:
         return self.is_valid
+    
+    @staticmethod
+    def ok(message: str = "") -> "ValidationResult":
+        """Создает успешный результат."""
+        return ValidationResult(True, message)
+    
+    @staticmethod
+    def fail(message: str) -> "ValidationResult":
+        """Создает результат с ошибкой."""
+        return ValidationResult(False, message)
+
+
+# Успешные результаты с постоянным текстом создаются один раз и возвращаются
+# всеми вызовами; изменять их нельзя
+_OK_TEXT = ValidationResult.ok("Текст корректен")
+_OK_API_KEY = ValidationResult.ok("API ключ корректен")
+_OK_FILE_PATH = ValidationResult.ok("Путь к файлу корректен")
+_OK_GEOMETRY = ValidationResult.ok("Геометрия окна корректна")
+_OK_ENCODING = ValidationResult.ok("Кодировка корректна")
+_OK_LANG = ValidationResult.ok("Язык поддерживается")
+
+
+def _has_disallowed_chars(text: str) -> bool:
+    """Проверяет, есть ли в тексте символы вне разрешенного набора."""
+    if text.isascii():
+        return bool(text.translate(_ASCII_DELETE_TABLE))
+    return _TEXT_DISALLOWED_RE.search(text) is not None
+
+
+# Проверки текста и API ключа зависят только от входной строки, поэтому их
+# результаты кэшируются: повторная проверка того же буфера сводится к поиску в словаре
+@lru_cache(maxsize=256)
+def _validate_text_cached(text: str) -> Tuple[bool, str]:
+    """Валидирует входной текст для TTS."""
+    stripped = text.strip() if text else ""
+    if not stripped:
+        return False, "Текст не может быть пустым"
+    
+    text_length = len(stripped)
+    
+    if text_length > AppConfig.MAX_TEXT_LENGTH:
+        return (
+            False,
+            f"Текст слишком длинный. Максимум {AppConfig.MAX_TEXT_LENGTH} символов, "
+            f"введено {text_length}"
+        )
+    
+    # Проверка на подозрительные символы (пробелы по краям всегда допустимы)
+    if _has_disallowed_chars(stripped):
+        return (
+            False,
+            "Текст содержит недопустимые символы. Используйте только буквы, цифры и знаки препинания."
+        )
+    
+    return True, "Текст корректен"
+
+
+@lru_cache(maxsize=256)
+def _validate_api_key_cached(api_key: str) -> Tuple[bool, str]:
+    """Валидирует API ключ."""
+    if not api_key:
+        return False, "API ключ не может быть пустым"
+    
+    api_key = api_key.strip()
+    
+    if len(api_key) < AppConfig.MIN_API_KEY_LENGTH:
+        return (
+            False,
+            f"API ключ слишком короткий. Минимум {AppConfig.MIN_API_KEY_LENGTH} символов, "
+            f"введено {len(api_key)}"
+        )
+    
+    # Базовая проверка формата Google API ключа
+    if not api_key.startswith('AIza'):
+        return False, "API ключ должен начинаться с 'AIza'. Проверьте правильность ключа."
+    
+    # Проверка на допустимые символы
+    if not _APIKEY_ALPHABET.issuperset(api_key):
+        return (
+            False,
+            "API ключ содержит недопустимые символы. "
+            "Используйте только буквы, цифры, дефисы и подчеркивания."
+        )
+    
+    return True, "API ключ корректен"
+
+
+@lru_cache(maxsize=32)
+def _normalize_extensions(extensions: tuple) -> frozenset:
+    """Приводит список расширений к набору строк без точки в нижнем регистре."""
+    return frozenset(ext.lower().lstrip('.') for ext in extensions)
 
 
 class Validator:
@@ -25,134 +171,86 @@ class Validator:
     @staticmethod
     def validate_text(text: str) -> ValidationResult:
         """Валидирует входной текст для TTS."""
-        if not text or not text.strip():
-            return ValidationResult(False, "Текст не может быть пустым")
-        
-        text_length = len(text.strip())
-        
-        if text_length > AppConfig.MAX_TEXT_LENGTH:
-            return ValidationResult(
-                False, 
-                f"Текст слишком длинный. Максимум {AppConfig.MAX_TEXT_LENGTH} символов, "
-                f"введено {text_length}"
-            )
-        
-        # Проверка на подозрительные символы. Разрешаем буквы, цифры, пробелы и основные знаки препинания,
-        # а также символы, необходимые для тегов голоса: [], : /
-        if re.search(r'[^/\w\s\.,!?;:\-\(\)\"\'«»\n\r\[\]]', text, re.UNICODE):
-            return ValidationResult(
-                False,
-                "Текст содержит недопустимые символы. Используйте только буквы, цифры и знаки препинания."
-            )
-        
-        return ValidationResult(True, "Текст корректен")
+        # Кэшируются только тексты в пределах лимита, чтобы кэш не удерживал
+        # большие вставленные буферы; длинные проверяются без кэша
+        if text and len(text) > AppConfig.MAX_TEXT_LENGTH:
+            is_valid, message = _validate_text_cached.__wrapped__(text)
+        else:
+            is_valid, message = _validate_text_cached(text)
+        return _OK_TEXT if is_valid else ValidationResult.fail(message)
     
     @staticmethod
     def validate_voice(voice_name: str) -> ValidationResult:
         """Валидирует имя голоса."""
         if not voice_name:
-            return ValidationResult(False, "Голос не выбран")
+            return ValidationResult.fail("Голос не выбран")
         
-        if voice_name not in AppConfig.VOICES:
-            return ValidationResult(
-                False, 
+        if voice_name not in _VOICES_SET:
+            return ValidationResult.fail(
                 f"Неподдерживаемый голос: {voice_name}. "
-                f"Доступные голоса: {', '.join(AppConfig.VOICES[:5])}..."
+                f"Доступные голоса: {_VOICES_PREVIEW}..."
             )
         
-        return ValidationResult(True, f"Голос {voice_name} поддерживается")
+        return ValidationResult.ok(f"Голос {voice_name} поддерживается")
     
     @staticmethod
     def validate_api_key(api_key: str) -> ValidationResult:
         """Валидирует API ключ."""
-        if not api_key:
-            return ValidationResult(False, "API ключ не может быть пустым")
-        
-        api_key = api_key.strip()
-        
-        if len(api_key) < AppConfig.MIN_API_KEY_LENGTH:
-            return ValidationResult(
-                False,
-                f"API ключ слишком короткий. Минимум {AppConfig.MIN_API_KEY_LENGTH} символов, "
-                f"введено {len(api_key)}"
-            )
-        
-        # Базовая проверка формата Google API ключа
-        if not api_key.startswith('AIza'):
-            return ValidationResult(
-                False,
-                "API ключ должен начинаться с 'AIza'. Проверьте правильность ключа."
-            )
-        
-        # Проверка на допустимые символы
-        if not re.match(r'^[A-Za-z0-9_-]+$', api_key):
-            return ValidationResult(
-                False,
-                "API ключ содержит недопустимые символы. "
-                "Используйте только буквы, цифры, дефисы и подчеркивания."
-            )
-        
-        return ValidationResult(True, "API ключ корректен")
+        is_valid, message = _validate_api_key_cached(api_key)
+        return _OK_API_KEY if is_valid else ValidationResult.fail(message)
     
     @staticmethod
     def validate_file_path(file_path: str, allowed_extensions: list = None) -> ValidationResult:
         """Валидирует путь к файлу."""
         if not file_path:
-            return ValidationResult(False, "Путь к файлу не указан")
+            return ValidationResult.fail("Путь к файлу не указан")
         
         if allowed_extensions:
-            file_extension = file_path.lower().split('.')[-1]
-            if file_extension not in [ext.lower().lstrip('.') for ext in allowed_extensions]:
-                return ValidationResult(
-                    False,
+            file_extension = os.path.splitext(file_path)[1][1:].lower()
+            if file_extension not in _normalize_extensions(tuple(allowed_extensions)):
+                return ValidationResult.fail(
                     f"Неподдерживаемый формат файла. "
                     f"Разрешенные форматы: {', '.join(allowed_extensions)}"
                 )
         
         # Проверка на недопустимые символы в имени файла
-        import os
         filename = os.path.basename(file_path)
-        if re.search(r'[<>:"|?*]', filename):
-            return ValidationResult(
-                False,
+        if not _FILENAME_BAD.isdisjoint(filename):
+            return ValidationResult.fail(
                 "Имя файла содержит недопустимые символы: < > : \" | ? *"
             )
         
-        return ValidationResult(True, "Путь к файлу корректен")
+        return _OK_FILE_PATH
     
     @staticmethod
     def validate_theme(theme: str) -> ValidationResult:
         """Валидирует тему оформления."""
         if not theme:
-            return ValidationResult(False, "Тема не указана")
+            return ValidationResult.fail("Тема не указана")
         
-        if theme not in AppConfig.AVAILABLE_THEMES:
-            return ValidationResult(
-                False,
+        if theme not in _THEMES_SET:
+            return ValidationResult.fail(
                 f"Неподдерживаемая тема: {theme}. "
-                f"Доступные темы: {', '.join(AppConfig.AVAILABLE_THEMES)}"
+                f"Доступные темы: {_THEMES_STR}"
             )
         
-        return ValidationResult(True, f"Тема {theme} поддерживается")
+        return ValidationResult.ok(f"Тема {theme} поддерживается")
     
     @staticmethod
     def validate_audio_format(format_name: str) -> ValidationResult:
         """Валидирует формат аудио."""
-        supported_formats = ['wav', 'mp3']
-        
         if not format_name:
-            return ValidationResult(False, "Формат аудио не указан")
+            return ValidationResult.fail("Формат аудио не указан")
         
         format_name = format_name.lower().lstrip('.')
         
-        if format_name not in supported_formats:
-            return ValidationResult(
-                False,
+        if format_name not in _AUDIO_FORMATS_SET:
+            return ValidationResult.fail(
                 f"Неподдерживаемый формат аудио: {format_name}. "
-                f"Поддерживаемые форматы: {', '.join(supported_formats)}"
+                f"Поддерживаемые форматы: {_AUDIO_FORMATS_STR}"
             )
         
-        return ValidationResult(True, f"Формат {format_name} поддерживается")
+        return ValidationResult.ok(f"Формат {format_name} поддерживается")
     
     @staticmethod
     def get_text_length_status(text: str) -> Tuple[str, str]:
@@ -172,14 +270,9 @@ class Validator:
     @staticmethod
     def sanitize_filename(filename: str) -> str:
         """Очищает имя файла от недопустимых символов."""
-        # Удаляем недопустимые символы
-        sanitized = re.sub(r'[<>:"|?*]', '_', filename)
-        
-        # Удаляем множественные пробелы и подчеркивания
-        sanitized = re.sub(r'[_\s]+', '_', sanitized)
-        
-        # Убираем подчеркивания в начале и конце
-        sanitized = sanitized.strip('_')
+        # Серии недопустимых символов, пробелов и подчеркиваний заменяются одним '_',
+        # в начале и конце подчеркивания не остаются
+        sanitized = '_'.join(filename.translate(_SANITIZE_TABLE).split())
         
         # Если имя стало пустым, используем значение по умолчанию
         if not sanitized:
@@ -191,20 +284,18 @@ class Validator:
     def validate_window_geometry(x: int, y: int, width: int, height: int) -> ValidationResult:
         """Валидирует геометрию окна."""
         if width < AppConfig.MIN_WINDOW_WIDTH or height < AppConfig.MIN_WINDOW_HEIGHT:
-            return ValidationResult(
-                False,
+            return ValidationResult.fail(
                 f"Размер окна слишком мал. Минимум: "
                 f"{AppConfig.MIN_WINDOW_WIDTH}x{AppConfig.MIN_WINDOW_HEIGHT}"
             )
         
         # Проверяем, что окно не выходит за пределы экрана (базовая проверка)
         if x < -width or y < -height:
-            return ValidationResult(
-                False,
+            return ValidationResult.fail(
                 "Окно находится за пределами экрана"
             )
         
-        return ValidationResult(True, "Геометрия окна корректна")
+        return _OK_GEOMETRY
 
 
 class TextValidator:
@@ -216,27 +307,23 @@ class TextValidator:
         try:
             # Пытаемся закодировать в UTF-8
             text.encode('utf-8')
-            return ValidationResult(True, "Кодировка корректна")
+            return _OK_ENCODING
         except UnicodeEncodeError as e:
-            return ValidationResult(
-                False,
+            return ValidationResult.fail(
                 f"Ошибка кодировки: {e}. Используйте только UTF-8 совместимые символы."
             )
     
     @staticmethod
     def check_language_support(text: str) -> ValidationResult:
         """Проверяет поддержку языка."""
-        # Проверяем наличие кириллицы (основной язык приложения - русский)
-        has_cyrillic = bool(re.search(r'[а-яё]', text.lower()))
-        has_latin = bool(re.search(r'[a-z]', text.lower()))
-        
-        if not has_cyrillic and not has_latin:
-            return ValidationResult(
-                False,
+        # Проверяем наличие кириллицы (основной язык приложения - русский) или латиницы.
+        # Один поиск без учета регистра останавливается на первой подходящей букве
+        if not _LETTER_RE.search(text):
+            return ValidationResult.fail(
                 "Текст должен содержать буквы (русские или английские)"
             )
         
-        return ValidationResult(True, "Язык поддерживается")
+        return _OK_LANG
     
     @staticmethod
     def suggest_improvements(text: str) -> list:
@@ -244,25 +331,19 @@ class TextValidator:
         suggestions = []
         
         # Проверка на слишком длинные предложения
-        sentences = re.split(r'[.!?]+', text)
-        for sentence in sentences:
-            if len(sentence.strip()) > 200:
-                suggestions.append("Рассмотрите разбиение длинных предложений на более короткие")
-                break
+        if any(len(m.group().strip()) > 200 for m in _SENTENCE_RE.finditer(text)):
+            suggestions.append("Рассмотрите разбиение длинных предложений на более короткие")
         
         # Проверка на повторяющиеся слова
-        words = text.lower().split()
-        word_count = {}
-        for word in words:
-            if len(word) > 3:  # Игнорируем короткие слова
-                word_count[word] = word_count.get(word, 0) + 1
+        # Короткие слова игнорируются; порядок первого появления сохраняется
+        word_count = Counter(word for word in text.lower().split() if len(word) > 3)
         
         repeated_words = [word for word, count in word_count.items() if count > 5]
         if repeated_words:
             suggestions.append(f"Часто повторяющиеся слова: {', '.join(repeated_words[:3])}")
         
         # Проверка на отсутствие знаков препинания
-        if not re.search(r'[.!?]', text):
+        if not _PUNCT_RE.search(text):
             suggestions.append("Добавьте знаки препинания для лучшей интонации")
         
         return suggestions